@@ -0,0 +1,109 @@
+"""Coroutine versions of the most common Pyrinth lookups."""
+from __future__ import annotations
+
+import asyncio as _asyncio
+import typing as _typing
+import weakref as _weakref
+
+import pyrinth.projects as _projects
+import pyrinth.users as _users
+
+_T = _typing.TypeVar("_T")
+
+# More requests in flight than this only adds latency on the API side
+MAX_CONCURRENCY = 10
+
+# A semaphore is bound to the event loop it is first used on
+_limits: _weakref.WeakKeyDictionary = _weakref.WeakKeyDictionary()
+
+
+async def _run(func: _typing.Callable[..., _T], *args) -> _T:
+    loop = _asyncio.get_running_loop()
+    limit = _limits.get(loop)
+    if limit is None:
+        limit = _limits[loop] = _asyncio.Semaphore(MAX_CONCURRENCY)
+    async with limit:
+        return await _asyncio.to_thread(func, *args)
+
+
+async def afrom_id(id: str) -> _users.User:
+    """
+    Get a user from their ID or username.
+
+    Args:
+        id (str): The ID or username of the user
+
+    Returns:
+        (User): The user that was found
+    """
+    return await _run(_users.User.from_id, id)
+
+
+async def afrom_ids(ids: list[str]) -> list[_users.User]:
+    """
+    Get several users from their IDs or usernames in a single request.
+
+    Args:
+        ids (list[str]): The IDs or usernames of the users
+
+    Returns:
+        (list[User]): The users that were found
+    """
+    return await _run(_users.User.from_ids, ids)
+
+
+async def aprojects(user: _users.User) -> _typing.Sequence[_projects.Project]:
+    """
+    Get a user's projects.
+
+    Args:
+        user (User): The user whose projects to get
+
+    Returns:
+        (Sequence[Project]): The user's projects
+    """
+    return await _run(lambda: user.projects)
+
+
+async def afollowed_projects(
+    user: _users.User,
+) -> _typing.Sequence[_projects.Project]:
+    """
+    Get the projects a user follows.
+
+    Args:
+        user (User): The user whose followed projects to get
+
+    Returns:
+        (Sequence[Project]): The user's followed projects
+    """
+    return await _run(lambda: user.followed_projects)
+
+
+async def anotifications(
+    user: _users.User,
+) -> _typing.Sequence[_users.User._Notification]:
+    """
+    Get a user's notifications.
+
+    Args:
+        user (User): The user whose notifications to get
+
+    Returns:
+        (Sequence[User._Notification]): The user's notifications
+    """
+    return await _run(lambda: user.notifications)
+
+
+async def aget_project(id: str, authorization: str = "") -> _projects.Project:
+    """
+    Get a project from its ID or slug.
+
+    Args:
+        id (str): The ID or slug of the project
+        authorization (str): An optional authorization token
+
+    Returns:
+        (Project): The project that was found
+    """
+    return await _run(_projects.Project.get, id, authorization)
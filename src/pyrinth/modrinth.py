@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import requests as _requests
-
 import pyrinth.exceptions as _exceptions
 import pyrinth.models as _models
 import pyrinth.projects as _projects
+import pyrinth.util as _util
+
+_PROJECT_EXISTS_ERRORS = {
+    404: (_exceptions.NotFoundError, "The requested project was not found"),
+}
 
 
 class Modrinth:
@@ -22,15 +25,11 @@ class Modrinth:
         Returns:
             (bool): Whether the project exists
         """
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             f"https://api.modrinth.com/v2/project/{id}/check", timeout=60
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError("The requested project was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _PROJECT_EXISTS_ERRORS)
+        response: dict = _util.read_json(raw_response)
         return response.get("id", False)
 
     @staticmethod
@@ -46,14 +45,14 @@ class Modrinth:
         Returns:
             (list[Project]): The projects that were randomly found
         """
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/projects_random",
             params={"count": count},
             timeout=60,
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        response: dict = _util.read_json(raw_response)
         return [
             _projects.Project(_models.ProjectModel._from_json(project_json))
             for project_json in response
@@ -67,35 +66,35 @@ class Modrinth:
         @classmethod  # type: ignore
         @property
         def authors(cls) -> int:
-            raw_response = _requests.get(
+            raw_response = _util.SESSION.get(
                 "https://api.modrinth.com/v2/statistics", timeout=60
             )
-            response: dict = raw_response.json()
+            response: dict = _util.read_json(raw_response)
             return response.get("authors", ...)
 
         @classmethod  # type: ignore
         @property
         def files(cls) -> int:
-            raw_response = _requests.get(
+            raw_response = _util.SESSION.get(
                 "https://api.modrinth.com/v2/statistics", timeout=60
             )
-            response: dict = raw_response.json()
+            response: dict = _util.read_json(raw_response)
             return response.get("files", ...)
 
         @classmethod  # type: ignore
         @property
         def projects(cls) -> int:
-            raw_response = _requests.get(
+            raw_response = _util.SESSION.get(
                 "https://api.modrinth.com/v2/statistics", timeout=60
             )
-            response: dict = raw_response.json()
+            response: dict = _util.read_json(raw_response)
             return response.get("projects", ...)
 
         @classmethod  # type: ignore
         @property
         def versions(cls) -> int:
-            raw_response = _requests.get(
+            raw_response = _util.SESSION.get(
                 "https://api.modrinth.com/v2/statistics", timeout=60
             )
-            response: dict = raw_response.json()
+            response: dict = _util.read_json(raw_response)
             return response.get("versions", ...)
@@ -1,12 +1,11 @@
 """Project can be mods or modpacks and are created by users."""
 from __future__ import annotations
 
+import contextlib as _contextlib
 import dataclasses
 import datetime as _datetime
 import json as _json
 
-import requests as _requests
-
 import pyrinth.exceptions as _exceptions
 import pyrinth.literals as _literals
 import pyrinth.models as _models
@@ -14,6 +13,77 @@ import pyrinth.teams as _teams
 import pyrinth.users as _users
 import pyrinth.util as _util
 
+_PROJECT_ERRORS = {
+    404: (
+        _exceptions.NotFoundError,
+        "The requested project wasn't found or no authorization to see this project",
+    ),
+}
+_VERSION_ERRORS = {
+    404: (
+        _exceptions.NotFoundError,
+        "The requested version wasn't found or no authorization to see this version",
+    ),
+}
+_CREATE_VERSION_ERRORS = {
+    401: (_exceptions.NoAuthorizationError, "No authorization to create this version"),
+}
+_CHANGE_ICON_ERRORS = {
+    400: (_exceptions.InvalidParamError, "Invalid input for new icon"),
+}
+_DELETE_ICON_ERRORS = {
+    400: (_exceptions.InvalidParamError, "Invalid input"),
+    401: (_exceptions.NoAuthorizationError, "No authorization to edit this project"),
+}
+_ADD_GALLERY_IMAGE_ERRORS = {
+    401: (
+        _exceptions.NoAuthorizationError,
+        "No authorization to create a gallery image",
+    ),
+    404: (
+        _exceptions.NotFoundError,
+        "The requested project wasn't found or no authorization to see this project",
+    ),
+}
+_MODIFY_GALLERY_IMAGE_ERRORS = {
+    401: (
+        _exceptions.NoAuthorizationError,
+        "No authorization to edit this gallery image",
+    ),
+    404: (
+        _exceptions.NotFoundError,
+        "The requested project wasn't found or no authorization to see this project",
+    ),
+}
+_DELETE_GALLERY_IMAGE_ERRORS = {
+    400: (_exceptions.InvalidParamError, "Invalid URL or project specified"),
+    401: (
+        _exceptions.NoAuthorizationError,
+        "No authorization to delete this gallery image",
+    ),
+}
+_MODIFY_ERRORS = {
+    401: (_exceptions.NoAuthorizationError, "No authorization to edit this project"),
+    404: (
+        _exceptions.NotFoundError,
+        "The requested project wasn't found or no authorization to see this project",
+    ),
+}
+_DELETE_ERRORS = {
+    400: (_exceptions.NotFoundError, "The requested project was not found"),
+    401: (_exceptions.NoAuthorizationError, "No authorization to delete this project"),
+}
+_VERSION_FILE_ERRORS = {
+    404: (
+        _exceptions.NotFoundError,
+        "The requested version file wasn't found or no authorization to see this version",
+    ),
+}
+_DELETE_FILE_FROM_HASH_ERRORS = {
+    404: (_exceptions.NotFoundError, "The requested version was not found"),
+    401: (_exceptions.NoAuthorizationError, "No authorization to delete this file"),
+}
+
 
 class Project:
     """Project can be mods or modpacks and are created by users.
@@ -29,10 +99,8 @@ class Project:
     def donations(self) -> list[Project.Donation]:
         return _util.list_to_object(Project.Donation, self.project_model.donation_urls)
 
-    def _get_auth(self, auth: str | None) -> str:
-        if auth:
-            return auth
-        return self.project_model.auth
+    def _get_auth_headers(self, auth: str | None) -> dict:
+        return {"authorization": auth or self.project_model.auth}
 
     @staticmethod
     def get(id: str, authorization: str = "") -> Project:
@@ -49,19 +117,13 @@ class Project:
         Returns:
             (Project): The project that was found
         """
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             f"https://api.modrinth.com/v2/project/{id}",
             headers={"authorization": authorization},
             timeout=60,
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _PROJECT_ERRORS)
+        response: dict = _util.read_json(raw_response)
         response.update({"authorization": authorization})
         return Project(_models.ProjectModel._from_json(response))
 
@@ -78,14 +140,14 @@ class Project:
         Returns:
             (list[Project]): The projects that were found
         """
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/projects",
             params={"ids": _json.dumps(ids)},
             timeout=60,
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        response: dict = _util.read_json(raw_response)
         return [
             Project(_models.ProjectModel._from_json(project_json))
             for project_json in response
@@ -197,14 +259,14 @@ class Project:
             return 0
         files = latest.files
         for file in files:
-            file_content = _requests.get(file.url, timeout=60).content
+            file_content = _util.SESSION.get(file.url, timeout=60).content
             open(file.name, "wb").write(file_content)
         if recursive:
             dependencies = latest.dependencies
             for dep in dependencies:
                 files = dep.version.files
                 for file in files:
-                    file_content = _requests.get(file.url, timeout=60).content
+                    file_content = _util.SESSION.get(file.url, timeout=60).content
                     open(file.name, "wb").write(file_content)
         return 1
 
@@ -238,31 +300,25 @@ class Project:
             "featured": featured,
         }
         filters = _util.remove_null_values(filters)
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             f"https://api.modrinth.com/v2/project/{self.project_model.slug}/version",
             params=_util.json_to_query_params(filters),
-            headers={"authorization": self._get_auth(auth)},
+            headers=self._get_auth_headers(auth),
             timeout=60,
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _PROJECT_ERRORS)
+        response: dict = _util.read_json(raw_response)
         versions = [
             self.Version(_models.VersionModel._from_json(version))
             for version in response
         ]
         if not types:
             return versions
-        result = []
-        for version in versions:
-            if version.version_model.version_type in types:
-                result.append(version)
-        return result
+        return [
+            version
+            for version in versions
+            if version.version_model.version_type in types
+        ]
 
     def get_oldest_version(
         self,
@@ -331,17 +387,11 @@ class Project:
         Returns:
             (Project.Version): The version that was found
         """
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             f"https://api.modrinth.com/v2/version/{id}", timeout=60
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested version wasn't found or no authorization to see this version"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _VERSION_ERRORS)
+        response: dict = _util.read_json(raw_response)
         return Project.Version(_models.VersionModel._from_json(response))
 
     def create_version(
@@ -362,25 +412,20 @@ class Project:
         """
         version_model.project_id = self.id
 
-        files = {}
-
-        for file in version_model.file_parts:
-            files[file] = open(file, "rb")
-
-        raw_response = _requests.post(
-            "https://api.modrinth.com/v2/version",
-            headers={"authorization": self._get_auth(auth)},
-            data={"data": _json.dumps(version_model._to_json())},
-            files=files,
-            timeout=60,
-        )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to create this version"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        with _contextlib.ExitStack() as stack:
+            files = {
+                file: stack.enter_context(open(file, "rb"))
+                for file in version_model.file_parts
+            }
+            raw_response = _util.SESSION.post(
+                "https://api.modrinth.com/v2/version",
+                headers=self._get_auth_headers(auth),
+                data={"data": _json.dumps(version_model._to_json())},
+                files=files,
+                timeout=60,
+            )
+        _util.check_response(raw_response, _CREATE_VERSION_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     def change_icon(self, file_path: str, auth: str | None = None) -> bool:
@@ -397,18 +442,16 @@ class Project:
         Returns:
             (bool): Whether the project icon change was successful
         """
-        raw_response = _requests.patch(
-            f"https://api.modrinth.com/v2/project/{self.project_model.slug}/icon",
-            params={"ext": file_path.split(".")[-1]},
-            headers={"authorization": self._get_auth(auth)},
-            data=open(file_path, "rb"),
-            timeout=60,
-        )
-        match raw_response.status_code:
-            case 400:
-                raise _exceptions.InvalidParamError("Invalid input for new icon")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        with open(file_path, "rb") as file:
+            raw_response = _util.SESSION.patch(
+                f"https://api.modrinth.com/v2/project/{self.project_model.slug}/icon",
+                params={"ext": file_path.rpartition(".")[2]},
+                headers=self._get_auth_headers(auth),
+                data=file,
+                timeout=60,
+            )
+        _util.check_response(raw_response, _CHANGE_ICON_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     def delete_icon(self, auth: str | None = None) -> bool:
@@ -425,20 +468,13 @@ class Project:
         Returns:
             (bool): Whether the project icon deletion was successful
         """
-        raw_response = _requests.delete(
+        raw_response = _util.SESSION.delete(
             f"https://api.modrinth.com/v2/project/{self.project_model.slug}/icon",
-            headers={"authorization": self._get_auth(auth)},
+            headers=self._get_auth_headers(auth),
             timeout=60,
         )
-        match raw_response.status_code:
-            case 400:
-                raise _exceptions.InvalidParamError("Invalid input")
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to edit this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _DELETE_ICON_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     def add_gallery_image(
@@ -458,24 +494,16 @@ class Project:
         Returns:
             (bool): If the gallery image addition was successful
         """
-        raw_response = _requests.post(
-            f"https://api.modrinth.com/v2/project/{self.project_model.slug}/gallery",
-            headers={"authorization": self._get_auth(auth)},
-            params=image._to_json(),
-            data=open(image.file_path, "rb"),
-            timeout=60,
-        )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to create a gallery image"
-                )
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        with open(image.file_path, "rb") as file:
+            raw_response = _util.SESSION.post(
+                f"https://api.modrinth.com/v2/project/{self.project_model.slug}/gallery",
+                headers=self._get_auth_headers(auth),
+                params=image._to_json(),
+                data=file,
+                timeout=60,
+            )
+        _util.check_response(raw_response, _ADD_GALLERY_IMAGE_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     def modify_gallery_image(
@@ -513,23 +541,14 @@ class Project:
             "ordering": ordering,
         }
         modified_json = _util.remove_null_values(modified_json)
-        raw_response = _requests.patch(
+        raw_response = _util.SESSION.patch(
             f"https://api.modrinth.com/v2/project/{self.project_model.slug}/gallery",
             params=modified_json,
-            headers={"authorization": self._get_auth(auth)},
+            headers=self._get_auth_headers(auth),
             timeout=60,
         )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to edit this gallery image"
-                )
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _MODIFY_GALLERY_IMAGE_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     def delete_gallery_image(self, url: str, auth: str | None = None) -> bool:
@@ -551,21 +570,14 @@ class Project:
             raise _exceptions.InvalidParamError(
                 "Please use cdn.modrinth.com instead of cdn-raw.modrinth.com"
             )
-        raw_response = _requests.delete(
+        raw_response = _util.SESSION.delete(
             f"https://api.modrinth.com/v2/project/{self.project_model.slug}/gallery",
-            headers={"authorization": self._get_auth(auth)},
+            headers=self._get_auth_headers(auth),
             params={"url": url},
             timeout=60,
         )
-        match raw_response.status_code:
-            case 400:
-                raise _exceptions.InvalidParamError("Invalid URL or project specified")
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to delete this gallery image"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _DELETE_GALLERY_IMAGE_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     def modify(
@@ -647,26 +659,14 @@ class Project:
             raise _exceptions.InvalidParamError(
                 "Please specify at least 1 optional argument"
             )
-        raw_response = _requests.patch(
+        raw_response = _util.SESSION.patch(
             f"https://api.modrinth.com/v2/project/{self.project_model.slug}",
-            data=_json.dumps(modified_json),
-            headers={
-                "Content-Type": "application/json",
-                "authorization": self._get_auth(auth),
-            },
+            json=modified_json,
+            headers=self._get_auth_headers(auth),
             timeout=60,
         )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to edit this project"
-                )
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _MODIFY_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     @property
@@ -687,36 +687,23 @@ class Project:
         Returns:
             (bool): Whether the project deletion was successful
         """
-        raw_response = _requests.delete(
+        raw_response = _util.SESSION.delete(
             f"https://api.modrinth.com/v2/project/{self.project_model.slug}",
-            headers={"authorization": self._get_auth(auth)},
+            headers=self._get_auth_headers(auth),
             timeout=60,
         )
-        match raw_response.status_code:
-            case 400:
-                raise _exceptions.NotFoundError("The requested project was not found")
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to delete this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _DELETE_ERRORS)
+        _util.invalidate_project_lists()
         return True
 
     @property
     def dependencies(self) -> list[Project]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             f"https://api.modrinth.com/v2/project/{self.project_model.slug}/dependencies",
             timeout=60,
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _PROJECT_ERRORS)
+        response: dict = _util.read_json(raw_response)
         return [
             Project(_models.ProjectModel._from_json(dependency_json))
             for dependency_json in response.get("projects", ...)
@@ -761,10 +748,10 @@ class Project:
             params.update({"limit": str(limit)})
         if filters:
             params.update({"filters": _json.dumps(filters)})
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/search", params=params, timeout=60
         )
-        response: dict = raw_response.json()
+        response: dict = _util.read_json(raw_response)
         return [
             Project._SearchResult(_models._SearchResultModel._from_json(project))
             for project in response.get("hits", ...)
@@ -772,36 +759,24 @@ class Project:
 
     @property
     def team_members(self) -> list[_teams._Team._TeamMember]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             f"https://api.modrinth.com/v2/project/{self.project_model.id}/members",
             timeout=60,
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _PROJECT_ERRORS)
+        response: dict = _util.read_json(raw_response)
         return [
             _teams._Team._TeamMember._from_json(team_member) for team_member in response
         ]
 
     @property
     def team(self) -> _teams._Team:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             f"https://api.modrinth.com/v2/project/{self.project_model.id}/members",
             timeout=60,
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError(
-                    "The requested project wasn't found or no authorization to see this project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _PROJECT_ERRORS)
+        response: dict = _util.read_json(raw_response)
         return _teams._Team._from_json(response)
 
     def __repr__(self) -> str:
@@ -843,17 +818,11 @@ class Project:
             Returns:
                 (Project.Version): The version that was found
             """
-            raw_response = _requests.get(
+            raw_response = _util.SESSION.get(
                 f"https://api.modrinth.com/v2/version/{id}", timeout=60
             )
-            match raw_response.status_code:
-                case 404:
-                    raise _exceptions.NotFoundError(
-                        "The requested version wasn't found or no authorization to see this version"
-                    )
-            if not raw_response.ok:
-                raise _exceptions.InvalidRequestError(raw_response.text)
-            response: dict = raw_response.json()
+            _util.check_response(raw_response, _VERSION_ERRORS)
+            response: dict = _util.read_json(raw_response)
             return Project.Version(_models.VersionModel._from_json(response))
 
         @staticmethod
@@ -876,19 +845,13 @@ class Project:
             Returns:
                 (Project.Version): The version that was found
             """
-            raw_response = _requests.get(
+            raw_response = _util.SESSION.get(
                 f"https://api.modrinth.com/v2/version_file/{hash}",
                 params={"algorithm": algorithm, "multiple": str(multiple).lower()},
                 timeout=60,
             )
-            match raw_response.status_code:
-                case 404:
-                    raise _exceptions.NotFoundError(
-                        "The requested version file wasn't found or no authorization to see this version"
-                    )
-            if not raw_response.ok:
-                raise _exceptions.InvalidRequestError(raw_response.text)
-            response: dict = raw_response.json()
+            _util.check_response(raw_response, _VERSION_FILE_ERRORS)
+            response: dict = _util.read_json(raw_response)
             if isinstance(response, list):
                 return [
                     Project.Version(_models.VersionModel._from_json(version))
@@ -919,23 +882,14 @@ class Project:
             Returns:
                 (bool): If the file deletion was successful
             """
-            raw_response = _requests.delete(
+            raw_response = _util.SESSION.delete(
                 f"https://api.modrinth.com/v2/version_file/{hash}",
                 params={"algorithm": algorithm, "version_id": version_id},
                 headers={"authorization": auth},
                 timeout=60,
             )
-            match raw_response.status_code:
-                case 404:
-                    raise _exceptions.NotFoundError(
-                        "The requested version was not found"
-                    )
-                case 401:
-                    raise _exceptions.NoAuthorizationError(
-                        "No authorization to delete this file"
-                    )
-            if not raw_response.ok:
-                raise _exceptions.InvalidRequestError(raw_response.text)
+            _util.check_response(raw_response, _DELETE_FILE_FROM_HASH_ERRORS)
+            _util.invalidate_project_lists()
             return True
 
         @property
@@ -949,14 +903,14 @@ class Project:
                 recursive (bool, optional): Whether to also download the files of the dependencies
             """
             for file in self.files:
-                file_content = _requests.get(file.url, timeout=60).content
+                file_content = _util.SESSION.get(file.url, timeout=60).content
                 open(file.name, "wb").write(file_content)
             if recursive:
                 dependencies = self.dependencies
                 for dep in dependencies:
                     files = dep.version.files
                     for file in files:
-                        file_content = _requests.get(file.url, timeout=60).content
+                        file_content = _util.SESSION.get(file.url, timeout=60).content
                         open(file.name, "wb").write(file_content)
 
         @property
@@ -965,11 +919,7 @@ class Project:
 
         @property
         def primary_files(self) -> list[Project._File]:
-            result = []
-            for file in self.files:
-                if file.primary:
-                    result.append(file)
-            return result
+            return [file for file in self.files if file.primary]
 
         @property
         def author(self) -> _users.User:
@@ -1027,7 +977,7 @@ class Project:
             ordering: int = 0,
         ) -> None:
             self.file_path = file_path
-            self.ext = file_path.split(".")[-1]
+            self.ext = file_path.rpartition(".")[2]
             self.featured = str(featured).lower()
             self.title = title
             self.description = description
@@ -1076,7 +1026,7 @@ class Project:
             result.primary = file_json.get("primary", ...)
             result.size = file_json.get("size", ...)
             result.file_type = file_json.get("file_type", ...)
-            result.extension = result.name.split(".")[-1]
+            result.extension = result.name.rpartition(".")[2]
             return result
 
         def __repr__(self) -> str:
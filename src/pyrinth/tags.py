@@ -2,21 +2,20 @@ from __future__ import annotations
 
 import dataclasses
 
-import requests as _requests
-
 import pyrinth.exceptions as _exceptions
+import pyrinth.util as _util
 
 
 class Tag:
     @classmethod  # type: ignore
     @property
     def categories(cls) -> list[Tag._Category]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/tag/category", timeout=60
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: list[dict] = raw_response.json()
+        response: list[dict] = _util.read_json(raw_response)
         return [
             Tag._Category(
                 json.get("icon", ...),
@@ -30,12 +29,12 @@ class Tag:
     @classmethod  # type: ignore
     @property
     def loaders(cls) -> list[Tag._Loaders]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/tag/loader", timeout=60
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: list[dict] = raw_response.json()
+        response: list[dict] = _util.read_json(raw_response)
         return [
             Tag._Loaders(
                 json.get("icon", ...),
@@ -48,12 +47,12 @@ class Tag:
     @classmethod  # type: ignore
     @property
     def game_versions(cls) -> list[_GameVersion]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/tag/game_version", timeout=60
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: list[dict] = raw_response.json()
+        response: list[dict] = _util.read_json(raw_response)
         return [
             Tag._GameVersion(
                 json.get("version", ...),
@@ -67,12 +66,12 @@ class Tag:
     @classmethod  # type: ignore
     @property
     def licenses(cls) -> list[_License]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/tag/license", timeout=60
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: list[dict] = raw_response.json()
+        response: list[dict] = _util.read_json(raw_response)
         return [
             Tag._License(json.get("short", ...), json.get("name", ...))
             for json in response
@@ -81,12 +80,12 @@ class Tag:
     @classmethod  # type: ignore
     @property
     def donation_platforms(cls) -> list[Tag._DonationPlatform]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/tag/donation_platform", timeout=60
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: list[dict] = raw_response.json()
+        response: list[dict] = _util.read_json(raw_response)
         return [
             Tag._DonationPlatform(json.get("short", ...), json.get("name", ...))
             for json in response
@@ -95,12 +94,12 @@ class Tag:
     @classmethod  # type: ignore
     @property
     def report_types(cls) -> list[str]:
-        raw_response = _requests.get(
+        raw_response = _util.SESSION.get(
             "https://api.modrinth.com/v2/tag/report_type", timeout=60
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: list = raw_response.json()
+        response: list = _util.read_json(raw_response)
         return response
 
     @dataclasses.dataclass
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools as _functools
+
 import pyrinth.users as _users
 
 
@@ -32,7 +34,7 @@ class _Team:
         def __repr__(self) -> str:
             return "Team Member"
 
-        @property
+        @_functools.cached_property
         def user(self) -> _users.User:
             return _users.User._from_json(self._user)
 
@@ -1,9 +1,12 @@
 """Used for users."""
 from __future__ import annotations
 
+import collections.abc as _abc
+import concurrent.futures as _futures
+import contextlib as _contextlib
 import dataclasses
 import datetime as _datetime
-import json as _json
+import functools as _functools
 import typing as _typing
 
 import requests as _requests
@@ -13,6 +16,112 @@ import pyrinth.models as _models
 import pyrinth.projects as _projects
 import pyrinth.util as _util
 
+_PAYOUT_HISTORY_ERRORS = {
+    401: (
+        _exceptions.NoAuthorizationError,
+        "No authorization to get this user's payout history",
+    ),
+}
+_WITHDRAW_BALANCE_ERRORS = {
+    401: (
+        _exceptions.NoAuthorizationError,
+        "No authorization to withdraw this user's balance",
+    ),
+    404: (_exceptions.NotFoundError, "The requested user was not found"),
+}
+_CHANGE_AVATAR_ERRORS = {
+    401: (_exceptions.InvalidParamError, "Invalid format for new icon"),
+    404: (_exceptions.NotFoundError, "The requested user was not found"),
+}
+_USER_ERRORS = {
+    404: (_exceptions.NotFoundError, "The requested user was not found"),
+}
+_FOLLOWED_PROJECTS_ERRORS = {
+    401: (
+        _exceptions.NoAuthorizationError,
+        "No authorization to get this user's followed projects",
+    ),
+    404: (_exceptions.NotFoundError, "The requested user was not found"),
+}
+_NOTIFICATIONS_ERRORS = {
+    401: (
+        _exceptions.NoAuthorizationError,
+        "No authorization to get this user's notifications",
+    ),
+    404: (_exceptions.NotFoundError, "The requested user was not found"),
+}
+_CREATE_PROJECT_ERRORS = {
+    401: (_exceptions.NoAuthorizationError, "No authorization to create a project"),
+}
+_FOLLOW_PROJECT_ERRORS = {
+    400: (
+        _exceptions.NotFoundError,
+        "The requested project was not found or you are already following the specified project",
+    ),
+    401: (_exceptions.NoAuthorizationError, "No authorization to follow a project"),
+}
+_UNFOLLOW_PROJECT_ERRORS = {
+    400: (
+        _exceptions.NotFoundError,
+        "The requested project was not found or you are not following the specified project",
+    ),
+    401: (_exceptions.NoAuthorizationError, "No authorization to unfollow a project"),
+}
+_GET_FROM_AUTH_ERRORS = {
+    401: (_exceptions.InvalidParamError, "Invalid authorization token"),
+}
+
+_T = _typing.TypeVar("_T")
+
+
+class _LazyList(_abc.Sequence[_T]):
+    """A read-only list that builds each item from its JSON on first access.
+
+    It is a `Sequence` rather than a `list`, but like a list it compares
+    equal to lists holding the same items, and `+` gives a new list.
+    """
+
+    __slots__ = ("_raw", "_factory", "_items")
+
+    def __init__(self, raw: list[dict], factory: _typing.Callable[[dict], _T]) -> None:
+        self._raw = raw
+        self._factory = factory
+        self._items: dict[int, _T] = {}
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        index = range(len(self._raw))[index]
+        if index not in self._items:
+            self._items[index] = self._factory(self._raw[index])
+        return self._items[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, _LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: list) -> list:
+        return [*self, *other]
+
+    def __radd__(self, other: list) -> list:
+        return [*other, *self]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _to_project(project_json: dict) -> _projects.Project:
+    # The factory for the lazy project lists. It is a module-level function
+    # rather than a closure over pre-bound constructors so the lists stay
+    # picklable, and each call builds a single project on first access
+    return _projects.Project(_models.ProjectModel._from_json(project_json))
+
 
 class User:
     def __init__(self, user_model: _models._UserModel) -> None:
@@ -25,65 +134,49 @@ class User:
     def auth(self) -> str:
         return self.user_model.auth
 
+    @property
+    def _auth_headers(self) -> dict:
+        return {"authorization": self.user_model.auth}
+
     @staticmethod
     def _from_json(user_json: dict) -> User:
         return User(_models._UserModel._from_json(user_json))
 
     @property
     def payout_history(self) -> _PayoutHistory:
-        raw_response = _requests.get(
-            f"https://api.modrinth.com/v2/user/{self.user_model.username}/payouts",
-            headers={"authorization": self.user_model.auth},
+        raw_response = _util.SESSION.get(
+            f"{_util.API_URL}/user/{self.user_model.username}/payouts",
+            headers=self._auth_headers,
             timeout=60,
         )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to get this user's payout history"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _PAYOUT_HISTORY_ERRORS)
+        response: dict = _util.read_json(raw_response)
         return User._PayoutHistory(
             response["all_time"], response["last_month"], response["payouts"]
         )
 
     def withdraw_balance(self, amount: int) -> _typing.Literal[True]:
-        raw_response = _requests.post(
-            f"https://api.modrinth.com/v2/user/{self.user_model.id}/payouts",
-            headers={
-                "content-type": "application/json",
-                "authorization": self.user_model.auth,
-            },
+        raw_response = _util.SESSION.post(
+            f"{_util.API_URL}/user/{self.user_model.id}/payouts",
+            headers=self._auth_headers,
             json={"amount": amount},
             timeout=60,
         )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to withdraw this user's balance"
-                )
-            case 404:
-                raise _exceptions.NotFoundError("The requested user was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _WITHDRAW_BALANCE_ERRORS)
+        User.invalidate(self.user_model.id, self.user_model.username)
         return True
 
     def change_avatar(self, file_path) -> _typing.Literal[True]:
-        raw_response = _requests.patch(
-            f"https://api.modrinth.com/v2/user/{self.user_model.id}/icon",
-            headers={"authorization": self.user_model.auth},
-            params={"ext": file_path.split(".")[-1]},
-            data=open(file_path, "rb"),
-            timeout=60,
-        )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.InvalidParamError("Invalid format for new icon")
-            case 404:
-                raise _exceptions.NotFoundError("The requested user was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        with open(file_path, "rb") as file:
+            raw_response = _util.SESSION.patch(
+                f"{_util.API_URL}/user/{self.user_model.id}/icon",
+                headers=self._auth_headers,
+                params={"ext": file_path.rpartition(".")[2]},
+                data=file,
+                timeout=60,
+            )
+        _util.check_response(raw_response, _CHANGE_AVATAR_ERRORS)
+        User.invalidate(self.user_model.id, self.user_model.username)
         return True
 
     @staticmethod
@@ -101,64 +194,68 @@ class User:
         Returns:
             (User): The user that was found
         """
-        raw_response = _requests.get(
-            f"https://api.modrinth.com/v2/user/{id}", timeout=60
-        )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError("The requested user was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        raw_response = _util.cached_get(f"{_util.API_URL}/user/{id}", timeout=60)
+        _util.check_response(raw_response, _USER_ERRORS)
+        response: dict = _util.read_json(raw_response)
         response.update({"authorization": auth})
         return User(_models._UserModel._from_json(response))
 
-    @property
+    @_functools.cached_property
     def date_created(self) -> _datetime.datetime:
         return _util.format_time(self.user_model.created)
 
     @property
-    def followed_projects(self) -> list[_projects.Project]:
-        raw_response = _requests.get(
-            f"https://api.modrinth.com/v2/user/{self.user_model.username}/follows",
-            headers={"authorization": self.user_model.auth},
+    def followed_projects(self) -> _typing.Sequence[_projects.Project]:
+        """The projects the user follows.
+
+        Each `Project` is built on first access. The result is a read-only
+        `Sequence`, so use `list(...)` to get a mutable list.
+
+        Returns:
+            (Sequence[Project]): The user's followed projects
+        """
+        return _LazyList(_util.read_json(self._get_followed_projects()), _to_project)
+
+    def iter_followed_projects(self) -> _typing.Iterator[_projects.Project]:
+        """Iterate over the user's followed projects.
+
+        The response is decoded in one go, but each `Project` is only built
+        when the iterator reaches it.
+
+        Yields:
+            (Project): The next followed project
+        """
+        project, from_json = _projects.Project, _models.ProjectModel._from_json
+        for project_json in _util.read_json(self._get_followed_projects()):
+            yield project(from_json(project_json))
+
+    def _get_followed_projects(self) -> _requests.Response:
+        raw_response = _util.cached_get(
+            f"{_util.API_URL}/user/{self.user_model.username}/follows",
+            headers=self._auth_headers,
             timeout=60,
         )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to get this user's followed projects"
-                )
-            case 404:
-                raise _exceptions.NotFoundError("The requested user was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
-        return [
-            _projects.Project(_models.ProjectModel._from_json(project_json))
-            for project_json in response
-        ]
+        _util.check_response(raw_response, _FOLLOWED_PROJECTS_ERRORS)
+        return raw_response
 
     @property
-    def notifications(self) -> list[_Notification]:
-        raw_response = _requests.get(
-            f"https://api.modrinth.com/v2/user/{self.user_model.username}/notifications",
-            headers={"authorization": self.user_model.auth},
+    def notifications(self) -> _typing.Sequence[_Notification]:
+        """The user's notifications.
+
+        Each notification is built on first access. The result is a
+        read-only `Sequence`, so use `list(...)` to get a mutable list.
+
+        Returns:
+            (Sequence[User._Notification]): The user's notifications
+        """
+        raw_response = _util.SESSION.get(
+            f"{_util.API_URL}/user/{self.user_model.username}/notifications",
+            headers=self._auth_headers,
             timeout=60,
         )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to get this user's notifications"
-                )
-            case 404:
-                raise _exceptions.NotFoundError("The requested user was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
-        return [
-            User._Notification._from_json(notification) for notification in response
-        ]
+        _util.check_response(raw_response, _NOTIFICATIONS_ERRORS)
+        response: list[dict] = _util.read_json(raw_response)
+        return _LazyList(response, User._Notification._from_json)
 
     def create_project(
         self, project_model: _models.ProjectModel, icon: str | None = None
@@ -174,39 +271,60 @@ class User:
             (int): If the project creation was successful
         """
         files: dict = {"data": project_model._to_bytes()}
-        if icon:
-            files.update({"icon": open(icon, "rb")})
-        raw_response = _requests.post(
-            "https://api.modrinth.com/v2/project",
-            files=files,
-            headers={"authorization": self.user_model.auth},
-            timeout=60,
-        )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to create a project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        with _contextlib.ExitStack() as stack:
+            if icon:
+                files.update({"icon": stack.enter_context(open(icon, "rb"))})
+            raw_response = _util.SESSION.post(
+                f"{_util.API_URL}/project",
+                files=files,
+                headers=self._auth_headers,
+                timeout=60,
+            )
+        _util.check_response(raw_response, _CREATE_PROJECT_ERRORS)
+        User.invalidate(self.user_model.id, self.user_model.username)
         return True
 
     @property
-    def projects(self) -> list[_projects.Project]:
-        raw_response = _requests.get(
-            f"https://api.modrinth.com/v2/user/{self.user_model.id}/projects",
+    def projects(self) -> _typing.Sequence[_projects.Project]:
+        """The user's projects.
+
+        Each `Project` is built on first access. The result is a read-only
+        `Sequence`, so use `list(...)` to get a mutable list.
+
+        Returns:
+            (Sequence[Project]): The user's projects
+        """
+        return _LazyList(_util.read_json(self._get_projects()), _to_project)
+
+    def iter_projects(self) -> _typing.Iterator[_projects.Project]:
+        """Iterate over the user's projects.
+
+        The response is decoded in one go, but each `Project` is only built
+        when the iterator reaches it.
+
+        Yields:
+            (Project): The next project
+        """
+        project, from_json = _projects.Project, _models.ProjectModel._from_json
+        for project_json in _util.read_json(self._get_projects()):
+            yield project(from_json(project_json))
+
+    @property
+    def amount_of_projects(self) -> int:
+        """Count the user's projects without building a `Project` for each one.
+
+        Returns:
+            (int): The number of projects the user has
+        """
+        return len(self.projects)
+
+    def _get_projects(self) -> _requests.Response:
+        raw_response = _util.cached_get(
+            f"{_util.API_URL}/user/{self.user_model.id}/projects",
             timeout=60,
         )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError("The requested user was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
-        return [
-            _projects.Project(_models.ProjectModel._from_json(project_json))
-            for project_json in response
-        ]
+        _util.check_response(raw_response, _USER_ERRORS)
+        return raw_response
 
     def follow_project(self, id: str) -> int:
         """
@@ -218,22 +336,17 @@ class User:
         Returns:
             (int): If the project follow was successful
         """
-        raw_response = _requests.post(
-            f"https://api.modrinth.com/v2/project/{id}/follow",
-            headers={"authorization": self.user_model.auth},
+        self._follow(id)
+        User.invalidate(self.user_model.id, self.user_model.username)
+        return True
+
+    def _follow(self, id: str) -> int:
+        raw_response = _util.SESSION.post(
+            f"{_util.API_URL}/project/{id}/follow",
+            headers=self._auth_headers,
             timeout=60,
         )
-        match raw_response.status_code:
-            case 400:
-                raise _exceptions.NotFoundError(
-                    "The requested project was not found or you are already following the specified project"
-                )
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to follow a project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _FOLLOW_PROJECT_ERRORS)
         return True
 
     def unfollow_project(self, id: str) -> int:
@@ -246,24 +359,75 @@ class User:
         Returns:
             (int): If the project unfollow was successful
         """
-        raw_response = _requests.delete(
-            f"https://api.modrinth.com/v2/project/{id}/follow",
-            headers={"authorization": self.user_model.auth},
+        self._unfollow(id)
+        User.invalidate(self.user_model.id, self.user_model.username)
+        return True
+
+    def _unfollow(self, id: str) -> int:
+        raw_response = _util.SESSION.delete(
+            f"{_util.API_URL}/project/{id}/follow",
+            headers=self._auth_headers,
             timeout=60,
         )
-        match raw_response.status_code:
-            case 400:
-                raise _exceptions.NotFoundError(
-                    "The requested project was not found or you are not following the specified project"
-                )
-            case 401:
-                raise _exceptions.NoAuthorizationError(
-                    "No authorization to unfollow a project"
-                )
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
+        _util.check_response(raw_response, _UNFOLLOW_PROJECT_ERRORS)
         return True
 
+    def fetch_all(
+        self,
+        which: _typing.Iterable[str] = (
+            "projects",
+            "followed_projects",
+            "notifications",
+        ),
+    ) -> dict[str, _typing.Any]:
+        """
+        Fetch several of the user's properties in parallel.
+
+        Args:
+            which (Iterable[str], optional): The names of the properties to fetch. Defaults to projects, followed projects and notifications
+
+        Returns:
+            (dict[str, Any]): The value of each property, keyed by its name
+        """
+        which = tuple(which)
+        with _futures.ThreadPoolExecutor(max(len(which), 1)) as executor:
+            futures = {name: executor.submit(getattr, self, name) for name in which}
+            return {name: future.result() for name, future in futures.items()}
+
+    def follow_projects(self, ids: list[str], max_workers: int = 8) -> list[int]:
+        """
+        Follow multiple projects, sending the requests in parallel.
+
+        Args:
+            ids (list[str]): The IDs of the projects to follow
+            max_workers (int, optional): The maximum number of requests in flight. Defaults to 8
+
+        Returns:
+            (list[int]): If each project follow was successful
+        """
+        try:
+            with _futures.ThreadPoolExecutor(max_workers) as executor:
+                return list(executor.map(self._follow, ids))
+        finally:
+            User.invalidate(self.user_model.id, self.user_model.username)
+
+    def unfollow_projects(self, ids: list[str], max_workers: int = 8) -> list[int]:
+        """
+        Unfollow multiple projects, sending the requests in parallel.
+
+        Args:
+            ids (list[str]): The IDs of the projects to unfollow
+            max_workers (int, optional): The maximum number of requests in flight. Defaults to 8
+
+        Returns:
+            (list[int]): If each project unfollow was successful
+        """
+        try:
+            with _futures.ThreadPoolExecutor(max_workers) as executor:
+                return list(executor.map(self._unfollow, ids))
+        finally:
+            User.invalidate(self.user_model.id, self.user_model.username)
+
     @staticmethod
     def get_from_auth(auth: str) -> User:
         """
@@ -272,20 +436,18 @@ class User:
         Returns:
             (User): The user that was found using the authorization token
         """
-        raw_response = _requests.get(
-            "https://api.modrinth.com/v2/user",
+        raw_response = _util.SESSION.get(
+            f"{_util.API_URL}/user",
             headers={"authorization": auth},
             timeout=60,
         )
-        match raw_response.status_code:
-            case 401:
-                raise _exceptions.InvalidParamError("Invalid authorization token")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
+        _util.check_response(raw_response, _GET_FROM_AUTH_ERRORS)
+        response: dict = _util.read_json(raw_response)
         response.update({"authorization": auth})
         return User._from_json(response)
 
+    from_auth = get_from_auth
+
     @staticmethod
     def from_id(id: str) -> User:
         """
@@ -295,35 +457,67 @@ class User:
             (User): The user that was found using the ID
 
         """
-        raw_response = _requests.get(
-            f"https://api.modrinth.com/v2/user/{id}", timeout=60
-        )
-        match raw_response.status_code:
-            case 404:
-                raise _exceptions.NotFoundError("The requested user was not found")
-        if not raw_response.ok:
-            raise _exceptions.InvalidRequestError(raw_response.text)
-        return User._from_json(raw_response.json())
+        raw_response = _util.cached_get(f"{_util.API_URL}/user/{id}", timeout=60)
+        _util.check_response(raw_response, _USER_ERRORS)
+        return User._from_json(_util.read_json(raw_response))
+
+    @staticmethod
+    def invalidate(*ids: str) -> None:
+        """Drop the cached responses for users.
+
+        Args:
+            *ids (str): The IDs or usernames of the users
+        """
+        for id in ids:
+            _util.invalidate_cache(f"{_util.API_URL}/user/{id}")
+        _util.invalidate_cache(f"{_util.API_URL}/users")
 
     @staticmethod
-    def from_ids(ids: list[str]) -> list[User]:
+    def from_ids(ids: list[str], auth=None) -> list[User]:
         """
         Get a users from IDs.
 
+        Args:
+            ids (list[str]): The IDs of the users to find
+            auth (str, optional): The authorization token to give the users. Defaults to None
+
         Returns:
             (User): The users that were found using the IDs
 
         """
-        raw_response = _requests.get(
-            "https://api.modrinth.com/v2/users",
-            params={"ids": _json.dumps(ids)},
+        raw_response = _util.cached_get(
+            f"{_util.API_URL}/users",
+            params={"ids": _util.dumps(ids)},
             timeout=60,
         )
         if not raw_response.ok:
             raise _exceptions.InvalidRequestError(raw_response.text)
-        response: dict = raw_response.json()
-        return [User.get(user.get("username")) for user in response]
+        response: list[dict] = _util.read_json(raw_response)
+        for user_json in response:
+            user_json.update({"authorization": auth})
+        return [User._from_json(user_json) for user_json in response]
+
+    @staticmethod
+    def from_ids_concurrent(ids: list[str], max_workers: int = 16) -> list[User]:
+        """
+        Get users from IDs, fetching each user on its own request in parallel.
+
+        Prefer `User.from_ids`, which needs a single request. This is for
+        callers that need the per-user endpoint. Requests share the pooled
+        session, so keep `max_workers` within its pool size. Rate limited
+        responses (429) are retried after the server's Retry-After delay.
 
+        Args:
+            ids (list[str]): The IDs of the users to find
+            max_workers (int, optional): The maximum number of requests in flight. Defaults to 16
+
+        Returns:
+            (list[User]): The users that were found, in the same order as `ids`
+        """
+        with _futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(User.from_id, ids))
+
+    @dataclasses.dataclass(slots=True, eq=False)
     class _Notification:
         """Used for the user's notifications."""
 
@@ -336,27 +530,35 @@ class User:
         read: str
         created: str
         actions: str
-        project_title: str
+        project_title: str | None = None
+
+        _FIELDS = (
+            "id",
+            "user_id",
+            "type",
+            "title",
+            "text",
+            "link",
+            "read",
+            "created",
+            "actions",
+        )
 
         def __repr__(self) -> str:
             return f"Notification: {self.text}"
 
         @staticmethod
         def _from_json(notification_json: dict) -> User._Notification:
-            result = User._Notification()
-            result.id = notification_json.get("id", ...)
-            result.user_id = notification_json.get("user_id", ...)
-            result.type = notification_json.get("type", ...)
-            result.title = notification_json.get("title", ...)
-            result.text = notification_json.get("text", ...)
-            result.link = notification_json.get("link", ...)
-            result.read = notification_json.get("read", ...)
-            result.created = notification_json.get("created", ...)
-            result.actions = notification_json.get("actions", ...)
-            result.project_title = result.title.split("**")[1]
+            get = notification_json.get
+            result = User._Notification(
+                *[get(field, ...) for field in User._Notification._FIELDS]
+            )
+            if isinstance(result.title, str):
+                _, _, rest = result.title.partition("**")
+                result.project_title, _, _ = rest.partition("**")
             return result
 
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class _PayoutHistory:
         all_time: float
         last_month: float
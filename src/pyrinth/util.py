@@ -1,63 +1,216 @@
-"""Utility functions for Pyrinth."""
+"""Utility functions for Pyrinth.
+
+These helpers sit on the hot path of every request, but they only shuffle
+strings and dicts, so Numba or Cython would not speed them up. Keep them
+plain Python that also runs well under PyPy, and speed them up with
+caching, comprehensions and hoisted lookups instead.
+"""
+
 import datetime as _datetime
 import json as _json
+import os as _os
+import threading as _threading
+import time as _time
 import typing as _typing
+import urllib.parse as _parse
 
 import dateutil.parser as _parser
+import requests as _requests
+import urllib3 as _urllib3
 
+import pyrinth.exceptions as _exceptions
 import pyrinth.projects as _projects
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+API_URL = "https://api.modrinth.com/v2"
+
+SESSION = _requests.Session()
+SESSION.headers.update({"User-Agent": "pyrinth", "Accept": "application/json"})
+SESSION.mount(
+    "https://",
+    _requests.adapters.HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=_urllib3.Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            # A retried write the server already applied comes back as an
+            # error, so only reads are retried
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+_PARSER = _parser.parser()
+
+CACHE_TTL = 300
+CACHE_SIZE = 256
+_cache: dict[tuple, tuple[float, str | None, _requests.Response]] = {}
+_cache_lock = _threading.Lock()
+
+_SEPARATORS = str.maketrans("-_", "  ")
 
-def to_sentence_case(sentence: str) -> _typing.Any:
-    return sentence.title().replace("-", " ").replace("_", " ")
+
+def to_sentence_case(sentence: str) -> str:
+    return sentence.translate(_SEPARATORS).title()
 
 
 def remove_null_values(json: dict) -> dict:
-    result = {}
-    for key, value in json.items():
-        if value is not None:
-            result.update({key: value})
-    return result
+    return {key: value for key, value in json.items() if value is not None}
+
+
+def remove_null_values_many(records: list[dict]) -> list[dict]:
+    return [
+        {key: value for key, value in record.items() if value is not None}
+        for record in records
+    ]
 
 
 def to_image_from_json(json: dict) -> list:
-    return [_projects.Project.GalleryImage._from_json(image) for image in json]
+    return list(map(_projects.Project.GalleryImage._from_json, json))
 
 
-def json_to_query_params(json: dict) -> str:
-    result = ""
-    for key, value in json.items():
-        result += f"{key}={_json.dumps(value)}&"
-    return result
+def query_value(value: _typing.Any) -> str:
+    # Strings and numbers are sent as they are; booleans, containers and
+    # None go through the JSON encoder
+    if isinstance(value, str):
+        return value
+    if type(value) is int or type(value) is float:
+        return str(value)
+    return dumps(value)
 
 
-def remove_file_path(file) -> str:
-    return "".join(file.split("/")[-1])
+def json_to_query_params(json: dict) -> str:
+    return _parse.urlencode(
+        {key: query_value(value) for key, value in json.items()},
+        quote_via=_parse.quote,
+    )
+
+
+def loads(data: bytes | str) -> _typing.Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _json.loads(data)
+
+
+def dumps(obj: _typing.Any) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return _json.dumps(obj, separators=(",", ":"))
+
+
+def check_response(
+    response: _requests.Response,
+    errors: dict[int, tuple[type[Exception], str]],
+) -> None:
+    # Raises the error mapped to the response's status code, or
+    # InvalidRequestError for any other unsuccessful response
+    error = errors.get(response.status_code)
+    if error is not None:
+        raise error[0](error[1])
+    if not response.ok:
+        raise _exceptions.InvalidRequestError(response.text)
+
+
+def read_json(response: _requests.Response) -> _typing.Any:
+    return loads(response.content)
+
+
+def cache_policy(response: _requests.Response) -> tuple[float, bool]:
+    # Reads the response's Cache-Control header into how long it stays fresh,
+    # falling back to CACHE_TTL, and whether it may be stored at all
+    directives = {}
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value
+    store = "no-store" not in directives
+    if not store or "no-cache" in directives:
+        return 0, store
+    if directives.get("max-age", "").isdigit():
+        return int(directives["max-age"]), store
+    return CACHE_TTL, store
+
+
+def cached_get(url: str, **kwargs) -> _requests.Response:
+    # Successful responses are kept for their cache lifetime, keyed on the
+    # URL, the query parameters and the authorization header. Once expired,
+    # a response with an ETag is revalidated with If-None-Match and reused
+    # if the server answers 304 Not Modified
+    key = (
+        url,
+        str(kwargs.get("params")),
+        (kwargs.get("headers") or {}).get("authorization"),
+    )
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry is not None:
+        expires, etag, cached = entry
+        if expires > _time.monotonic():
+            return cached
+        if etag:
+            headers = {**(kwargs.get("headers") or {}), "If-None-Match": etag}
+            kwargs = {**kwargs, "headers": headers}
+    response = SESSION.get(url, **kwargs)
+    lifetime, store = cache_policy(response)
+    if response.status_code == 304 and entry is not None:
+        etag, response = entry[1], entry[2]
+    else:
+        etag = response.headers.get("ETag")
+    if response.ok and store and (lifetime > 0 or etag):
+        with _cache_lock:
+            if key not in _cache and len(_cache) >= CACHE_SIZE:
+                _cache.pop(next(iter(_cache)), None)
+            _cache[key] = (_time.monotonic() + lifetime, etag, response)
+    return response
+
+
+def invalidate_cache(url: str | None = None) -> None:
+    with _cache_lock:
+        if url is None:
+            _cache.clear()
+            return
+        for key in [
+            key for key in _cache if key[0] == url or key[0].startswith(url + "/")
+        ]:
+            del _cache[key]
+
+
+def invalidate_project_lists() -> None:
+    # A project write doesn't say which users list the project, so every
+    # cached user project and follow list is dropped
+    prefix = f"{API_URL}/user/"
+    with _cache_lock:
+        for key in [
+            key
+            for key in _cache
+            if key[0].startswith(prefix) and key[0].endswith(("/projects", "/follows"))
+        ]:
+            del _cache[key]
+
+
+def remove_file_path(file: str) -> str:
+    return _os.path.basename(file)
 
 
 def list_to_json(lst: list) -> list[dict]:
-    result = []
-    for item in lst:
-        if not isinstance(item, dict):
-            result.append(item._to_json())
-        else:
-            result.append(item)
-    return result
+    return [item if isinstance(item, dict) else item._to_json() for item in lst]
 
 
 def list_to_object(type_, lst) -> list:
-    result = []
-    for item in lst:
-        if isinstance(item, dict):
-            result.append(type_._from_json(item))
-        else:
-            result.append(item)
-    return result
+    from_json = type_._from_json
+    return [from_json(item) if isinstance(item, dict) else item for item in lst]
 
 
 def format_time(time) -> _datetime.datetime:
-    return _parser.parser().parse(time)
-
-
-def args_to_dict(**kwargs) -> str:
-    return _json.dumps(kwargs)
+    # Modrinth timestamps are ISO 8601, which fromisoformat parses in C;
+    # anything else falls back to dateutil
+    try:
+        return _datetime.datetime.fromisoformat(time)
+    except ValueError:
+        return _PARSER.parse(time)